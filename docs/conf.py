@@ -1,11 +1,13 @@
 """Docs config."""
 
+from __future__ import annotations
+
 from datetime import date
-from hashlib import sha256
+from hashlib import file_digest
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ruamel.yaml import YAML
-from sphinx.application import Sphinx
 
 from boilercv_docs import DOCS, PYPROJECT, chdir_docs
 from boilercv_docs.intersphinx import get_ispx, get_rtd, get_url
@@ -13,6 +15,9 @@ from boilercv_docs.nbs import init_nb_env
 from boilercv_docs.patch_nbs import patch_nbs
 from boilercv_docs.types import IspxMappingValue
 
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+
 # ! Initialization
 patch_nbs()
 ROOT = chdir_docs()
@@ -22,6 +27,9 @@ STATIC = DOCS / "_static"
 """Static assets folder, used in configs and setup."""
 CSS = STATIC / "local.css"
 """Local CSS file, used in configs and setup."""
+with CSS.open("rb") as file:
+    CSS_HASH = file_digest(file, "sha256").hexdigest()
+"""Hash of the local CSS file contents, computed once to bust the cache on changes."""
 BIB_TEMPLATE = DOCS / "refs-template.bib"
 """Project template bibliography file."""
 BIB = DOCS / "refs.bib"
@@ -29,7 +37,7 @@ BIB = DOCS / "refs.bib"
 COPIER_ANSWERS = ROOT / ".copier-answers.yml"
 """Copier answers file."""
 # ! Template answers
-ANS = YAML().load(COPIER_ANSWERS.read_text(encoding="utf-8"))
+ANS = YAML().load(COPIER_ANSWERS.read_bytes().decode("utf-8"))
 """Project template answers."""
 AUTHORS = ANS["project_owner_name"]
 """Authors of the project."""
@@ -64,7 +72,8 @@ TIPPY_RTD_URLS = [
 """Tippy ReadTheDocs-compatible URLs."""
 REV = (
     Path("../requirements.txt")
-    .read_text(encoding="utf-8")
+    .read_bytes()
+    .decode("utf-8")
     .splitlines()[1]
     .split("@")[-1]
 )
@@ -90,7 +99,7 @@ def add_version_to_css(app: Sphinx, _pagename, _templatename, ctx, _doctree):
         return
     css = dpath(CSS)
     if css in ctx.get((k := "css_files"), {}):
-        ctx[k][ctx[k].index(css)] = f"{css}?hash={sha256(CSS.read_bytes()).hexdigest()}"
+        ctx[k][ctx[k].index(css)] = f"{css}?hash={CSS_HASH}"
 
 
 def dpaths(*paths: Path, rel: Path = DOCS) -> list[str]:
@@ -3,7 +3,6 @@
 from collections.abc import Callable, Iterable
 from pathlib import Path
 from re import finditer
-from shlex import quote
 from sys import executable
 from typing import cast, get_args
 
@@ -65,11 +64,6 @@ CORRELATIONS: dict[Corr, Callable[[], dict[Equation, Correlation]]] = {
 }
 
 
-def escape(path: Path) -> str:
-    """Escape path for running subprocesses."""
-    return quote(path.as_posix())
-
-
 def make_raw(content: str):
     """Convert escaped strings to raw strings."""
     for match in finditer(r'"[^"]*"', content):
@@ -1,8 +1,9 @@
 """Convert LaTeX equations to SymPy equations."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
 from re import sub
-from shlex import quote, split
 from subprocess import run
 from tomllib import loads
 from typing import get_args
@@ -22,7 +23,6 @@ from boilercv_pipeline.equations import (
     EQUATIONS,
     PIPX,
     SYMS,
-    escape,
     get_raw_equations_context,
     make_raw,
     sanitize_forms,
@@ -30,6 +30,16 @@ from boilercv_pipeline.equations import (
 
 LATEX_PARSER = Path("scripts") / "convert_latex_to_sympy.py"
 """Isolated LaTeX parser."""
+LATEX_PATTERN_REPLS = tuple(
+    Repl[Kind](src="latex", dst="latex", find=find, repl=repl)
+    for find, repl in {
+        r"\\left\(": "(",
+        r"\\right\)": ")",
+        r"\\,": "",
+        r"\\ ": " ",
+    }.items()
+)
+"""Replacements to sanitize LaTeX forms for parsing, built once."""
 APP = App()
 """CLI."""
 
@@ -42,21 +52,21 @@ def main():  # noqa: D103
 def default(corr: Corr | Range = "beta", overwrite: bool = False):  # noqa: D103
     equations_path = EQUATIONS[corr]
     logger.info("Start converting LaTeX expressions to SymPy expressions.")
-    content = equations_path.read_text("utf-8") if equations_path.exists() else ""
+    original = equations_path.read_bytes() if equations_path.exists() else b""
+    content = original.decode("utf-8")
     context = get_raw_equations_context(symbols=SYMS)
     equations = (
         Equations[str]
         .context_model_validate(obj=loads(content), context=context)
         .morph_cpipe(parse_equations, context, symbols=SYMS, overwrite=overwrite)
     )
-    equations_path.write_text(
-        encoding="utf-8",
-        data=make_raw(
-            sync(
-                reference=equations.model_dump(mode="json"), target=parse(content)
-            ).as_string()
-        ),
-    )
+    data = make_raw(
+        sync(
+            reference=equations.model_dump(mode="json"), target=parse(content)
+        ).as_string()
+    ).encode("utf-8")
+    if data != original:
+        equations_path.write_bytes(data)
     logger.info("Finish converting LaTeX expressions to SymPy expressions.")
 
 
@@ -64,12 +74,24 @@ def parse_equations(
     equations: Equations[str], symbols: tuple[str, ...], overwrite: bool
 ) -> Equations[str]:
     """Parse equations."""
-    for name, eq in tqdm(equations.items()):
-        if not overwrite and (eq.sympy or not eq.latex):
-            continue
-        equations[name] = convert(
-            forms=eq, symbols=symbols, interpreter=PIPX, script=LATEX_PARSER
+    names = [
+        name
+        for name, eq in equations.items()
+        if overwrite or (not eq.sympy and eq.latex)
+    ]
+    # ? Parsing spawns a subprocess per equation, so overlap the waits
+    with ThreadPoolExecutor() as executor:
+        converted = executor.map(
+            lambda name: convert(
+                forms=equations[name],
+                symbols=symbols,
+                interpreter=PIPX,
+                script=LATEX_PARSER,
+            ),
+            names,
         )
+        for name, forms in zip(names, tqdm(converted, total=len(names)), strict=True):
+            equations[name] = forms
     return equations
 
 
@@ -79,15 +101,7 @@ def convert(
     """Convert LaTeX equation to SymPy equation."""
     sanitized = replace_pattern(
         sanitize_forms(forms, symbols, sanitizer=sanitize_and_fold).model_dump(),
-        (
-            Repl(src="latex", dst="latex", find=find, repl=repl)
-            for find, repl in {
-                r"\\left\(": "(",
-                r"\\right\)": ")",
-                r"\\,": "",
-                r"\\ ": " ",
-            }.items()
-        ),
+        LATEX_PATTERN_REPLS,
     )["latex"]
     forms.sympy = (
         parse_ineq(sanitized, symbols, interpreter, script)
@@ -120,7 +134,7 @@ def parse_ineq(
 def parse_expr(interpreter, script, latex):
     """Parse expression."""
     result = run(
-        args=split(f"{escape(interpreter)} run {escape(script)} {quote(latex)}"),
+        args=[interpreter, "run", script, latex],
         capture_output=True,
         check=False,
         text=True,
@@ -145,41 +159,47 @@ def sanitize(forms: dict[Kind, str], symbols: tuple[str, ...]) -> Morph[Kind, st
     """Sanitize symbolic forms."""
     return (
         Morph[Kind, str](forms)
-        .morph_pipe(
-            replace,
-            (
-                Repl[Kind](src="sympy", dst="sympy", find=find, repl=repl)
+        .morph_pipe(replace, sympy_repls())
+        .morph_pipe(replace_pattern, sympy_pattern_repls(tuple(symbols)))
+    )
+
+
+@cache
+def sympy_repls() -> tuple[Repl[Kind], ...]:
+    """Literal replacements for sanitizing SymPy forms."""
+    return tuple(
+        Repl[Kind](src="sympy", dst="sympy", find=find, repl=repl)
+        for find, repl in {
+            "{b}": "b",
+            "{c}": "c",
+            "{bo}": "b0",
+            "{o}": "0",
+            ",": " , ",
+        }.items()
+    )
+
+
+@cache
+def sympy_pattern_repls(symbols: tuple[str, ...]) -> tuple[Repl[Kind], ...]:
+    """Per-symbol regex replacements for sanitizing SymPy forms, built once."""
+    return tuple(
+        Repl[Kind](src="sympy", dst="sympy", find=f, repl=r)
+        for f, r in {
+            # ? Unwrapped negative.
+            r"(?<!\()(-[\d.]+)(?!\()": r"(\g<1>)",
+            **{
+                find: repl
+                for sym in symbols
                 for find, repl in {
-                    "{b}": "b",
-                    "{c}": "c",
-                    "{bo}": "b0",
-                    "{o}": "0",
-                    ",": " , ",
+                    # ? Symbol split by `(` after first character.
+                    rf"{sym[0]}\*\({sym[1:]}([^)]+)\)": rf"{sym}\g<1>",
+                    # ? Symbol split by a `*` after first character.
+                    rf"{sym[0]}\*{sym[1:]}": rf"{sym}",
+                    # ? Symbol missing `*` resulting in failed call
+                    rf"{sym}\(": rf"{sym}*(",
                 }.items()
-            ),
-        )
-        .morph_pipe(
-            replace_pattern,
-            tuple(
-                Repl[Kind](src="sympy", dst="sympy", find=f, repl=r)
-                for f, r in {
-                    # ? Unwrapped negative.
-                    r"(?<!\()(-[\d.]+)(?!\()": r"(\g<1>)",
-                    **{
-                        find: repl
-                        for sym in symbols
-                        for find, repl in {
-                            # ? Symbol split by `(` after first character.
-                            rf"{sym[0]}\*\({sym[1:]}([^)]+)\)": rf"{sym}\g<1>",
-                            # ? Symbol split by a `*` after first character.
-                            rf"{sym[0]}\*{sym[1:]}": rf"{sym}",
-                            # ? Symbol missing `*` resulting in failed call
-                            rf"{sym}\(": rf"{sym}*(",
-                        }.items()
-                    },
-                }.items()
-            ),
-        )
+            },
+        }.items()
     )
 
 
@@ -1,7 +1,7 @@
 """Convert PNGs to LaTeX."""
 
+from functools import cache
 from pathlib import Path
-from shlex import split
 from subprocess import run
 from tomllib import loads
 from typing import get_args
@@ -22,7 +22,6 @@ from boilercv_pipeline.equations import (
     PIPX,
     PNGS,
     SYMS,
-    escape,
     get_raw_equations_context,
     make_raw,
     sanitize_forms,
@@ -44,7 +43,9 @@ def main():  # noqa: D103
 def default(corr: Corr = "beta", overwrite: bool = False):  # noqa: D103
     equations_path = EQUATIONS[corr]
     logger.info("Start converting images of equations to LaTeX.")
-    content = equations_path.read_text("utf-8") if equations_path.exists() else ""
+    content = (
+        equations_path.read_bytes().decode("utf-8") if equations_path.exists() else ""
+    )
     equations = (
         Equations[str]
         .context_model_validate(
@@ -79,15 +80,17 @@ def convert(
     forms: EquationForms[str], png: Path, symbols: tuple[str, ...]
 ) -> EquationForms[str]:
     """Convert PNGs to LaTeX."""
-    sep = " "
     sanitize_forms(forms, symbols, sanitizer=sanitize)
     result = run(
-        args=split(
-            sep.join([
-                f"{escape(PIPX)} run --pip-args '--extra-index-url {INDEX}' --",
-                f"{escape(PNG_PARSER)} {escape(png)}",
-            ])
-        ),
+        args=[
+            PIPX,
+            "run",
+            "--pip-args",
+            f"--extra-index-url {INDEX}",
+            "--",
+            PNG_PARSER,
+            png,
+        ],
         capture_output=True,
         check=False,
         text=True,
@@ -100,33 +103,36 @@ def convert(
 
 def sanitize(forms: dict[Kind, str], symbols: tuple[str, ...]) -> Morph[Kind, str]:
     """Sanitize LaTeX forms."""
-    syms_no_script = [s.split("_")[0] for s in symbols]
     return (
         Morph[Kind, str](forms)
-        .morph_pipe(
-            replace,
-            (
-                Repl[Kind](src="latex", dst="latex", find=find, repl=repl)
-                for find, repl in {
-                    **{" ".join(s): s for s in syms_no_script},
-                    **{s: rf" \{s}" for s in syms_no_script if len(s) < 3},
-                    **{rf"\{s}": rf" \{s}" for s in syms_no_script if len(s) >= 3},
-                    "F O": "Fo",
-                    "F 0": "Fo",
-                    "J a": "Ja",
-                    "{bo}": r"\bo",
-                    "{b0}": r"\bo",
-                    "{00}": r"\bo",
-                    "{o}": r"\o",
-                    "{0}": r"\o",
-                    "}": "} ",
-                    "(": " (",
-                }.items()
-            ),
-        )
+        .morph_pipe(replace, latex_repls(tuple(symbols)))
         .morph_pipe(fold_whitespace, Defaults(keys=get_args(Kind)))
     )
 
 
+@cache
+def latex_repls(symbols: tuple[str, ...]) -> tuple[Repl[Kind], ...]:
+    """Per-symbol replacements for sanitizing LaTeX forms, built once."""
+    syms_no_script = [s.split("_")[0] for s in symbols]
+    return tuple(
+        Repl[Kind](src="latex", dst="latex", find=find, repl=repl)
+        for find, repl in {
+            **{" ".join(s): s for s in syms_no_script},
+            **{s: rf" \{s}" for s in syms_no_script if len(s) < 3},
+            **{rf"\{s}": rf" \{s}" for s in syms_no_script if len(s) >= 3},
+            "F O": "Fo",
+            "F 0": "Fo",
+            "J a": "Ja",
+            "{bo}": r"\bo",
+            "{b0}": r"\bo",
+            "{00}": r"\bo",
+            "{o}": r"\o",
+            "{0}": r"\o",
+            "}": "} ",
+            "(": " (",
+        }.items()
+    )
+
+
 if __name__ == "__main__":
     main()
@@ -35,7 +35,9 @@ def default(corr: Corr = "beta"):  # noqa: D103
         Equations[str]
         .context_model_validate(
             obj=loads(
-                equations_path.read_text("utf-8") if equations_path.exists() else ""
+                equations_path.read_bytes().decode("utf-8")
+                if equations_path.exists()
+                else ""
             ),
             context=get_raw_equations_context(symbols=SYMS),
         )
@@ -46,7 +48,7 @@ def default(corr: Corr = "beta"):  # noqa: D103
         for name, eq in equations.items():
             if GROUPS[name] == group:
                 eq = prep_equation_forms(equations[name])["latex"]  # pyright: ignore[reportArgumentType]
-                eq = [m.strip() for m in findall(r"[\d \-/.]+", eq) if m.strip()]
+                eq = [s for m in findall(r"[\d \-/.]+", eq) if (s := m.strip())]
                 content += dedent(f"""
                     ### {name}
 
@@ -70,16 +70,18 @@ def make_docs():
     all_eqs = {corr: get_raw_equations(corr) for corr in get_args(Corr)}
     ranges = {name: r.latex for name, r in get_equations(RANGES_TOML).items()}
     meta = Metadata.context_model_validate(
-        obj=loads(META_TOML.read_text("utf-8") if META_TOML.exists() else ""),
+        obj=loads(META_TOML.read_bytes().decode("utf-8") if META_TOML.exists() else ""),
         context=Metadata.get_context(),
     )
+    by_group: dict[str, list[Equation]] = {}
+    for name in get_args(Equation):
+        by_group.setdefault(GROUPS[name], []).append(name)
     header = "# Correlation equations\n"
-    groups = ""
+    parts: list[str] = []
     for group in ["Group 1", "Group 3", "Group 4", "Group 5"]:
-        groups += f"\n## {group}\n"
-        for name in get_args(Equation):
-            if GROUPS[name] == group:
-                latex = f"""
+        parts.append(f"\n## {group}\n")
+        for name in by_group.get(group, []):
+            latex = f"""
 $$
 {all_eqs["nusselt"][name]}
 $$ (eq_nusselt_{name})
@@ -88,21 +90,23 @@ $$
 {all_eqs["beta"][name]}
 $$ (eq_beta_{name})
 """
-                latex += (
-                    f"""
+            latex += (
+                f"""
 $$
 {ranges[name]}
 $$ (eq_range_{name})
 """
-                    if ranges[name]
-                    else ""
-                )
-                long_name = meta[name].name
-                citekey = meta[name].citekey
-                groups += f"""
+                if ranges[name]
+                else ""
+            )
+            long_name = meta[name].name
+            citekey = meta[name].citekey
+            parts.append(f"""
 ### {long_name} {{cite}}`{citekey},tangReviewDirectContact2022`
-{latex}"""
-    OUT.write_text(encoding="utf-8", data=f"{header}\n{groups.strip()}\n")
+{latex}""")
+    data = f"{header}\n{''.join(parts).strip()}\n".encode()
+    if not OUT.exists() or OUT.read_bytes() != data:
+        OUT.write_bytes(data)
 
 
 def get_raw_equations(corr: Corr | Range) -> dict[Equation, str]:
@@ -111,7 +115,9 @@ def get_raw_equations(corr: Corr | Range) -> dict[Equation, str]:
         Equations[str]
         .context_model_validate(
             obj=loads(
-                EQUATIONS[corr].read_text("utf-8") if EQUATIONS[corr].exists() else ""
+                EQUATIONS[corr].read_bytes().decode("utf-8")
+                if EQUATIONS[corr].exists()
+                else ""
             ),
             context=get_raw_equations_context(symbols=SYMS),
         )
@@ -16,7 +16,9 @@ def main():  # noqa: D103
         encoding="utf-8",
         data=sync(
             reference=Metadata.context_model_validate(
-                obj=parse(META_TOML.read_text("utf-8") if META_TOML.exists() else ""),
+                obj=parse(
+                    META_TOML.read_bytes().decode("utf-8") if META_TOML.exists() else ""
+                ),
                 context=Metadata.get_context(),
             ).model_dump(mode="json"),
             target=TOMLDocument(),
@@ -21,7 +21,7 @@ def main():  # noqa: D103
                 .context_model_validate(
                     obj=(
                         content := parse(
-                            RANGES_TOML.read_text("utf-8")
+                            RANGES_TOML.read_bytes().decode("utf-8")
                             if RANGES_TOML.exists()
                             else ""
                         )
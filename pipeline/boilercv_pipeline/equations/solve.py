@@ -41,8 +41,10 @@ def default(corr: Corr = "beta", overwrite: bool = False):  # noqa: D103
     logger.info("Start generating symbolic equations.")
 
     # ? Produce equations and solutions model
-    eqns_content = loads(equations.read_text("utf-8") if equations.exists() else "")
-    solns_content = solutions.read_text("utf-8") if solutions.exists() else ""
+    eqns_content = loads(
+        equations.read_bytes().decode("utf-8") if equations.exists() else ""
+    )
+    solns_content = solutions.read_bytes().decode("utf-8") if solutions.exists() else ""
     symbols = tuple(dict(substitutions).keys())
 
     context = SolvedEquations[str].get_context(symbols=symbols, solve_syms=solve_syms)
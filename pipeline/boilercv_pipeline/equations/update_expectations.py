@@ -34,7 +34,7 @@ def default(corr: Corr = "beta", overwrite: bool = False):  # noqa: D103
     expectations = EXPECTATIONS[corr]
     substitutions = SUBSTITUTIONS[corr]
 
-    content = expectations.read_text("utf-8") if expectations.exists() else ""
+    content = expectations.read_bytes().decode("utf-8") if expectations.exists() else ""
     expec = Expectations[str](loads(content))
     for name, correlation in tqdm([
         (name, attr)
@@ -3,7 +3,7 @@
 from xarray import open_dataset
 
 from boilercv.data import VIDEO
-from boilercv.types import DA
+from boilercv.types import DA, Img
 from boilercv_pipeline.models.params import PARAMS
 
 EXAMPLE_NUM_FRAMES = 500
@@ -13,11 +13,13 @@ EXAMPLE_CONTOURS = PARAMS.paths.examples / f"{EXAMPLE_VIDEO_NAME}.h5"
 EXAMPLE_ROI = PARAMS.paths.examples / f"{EXAMPLE_VIDEO_NAME}_roi.yaml"
 
 
-def get_images() -> DA:
+def get_images(num_frames: int = EXAMPLE_NUM_FRAMES) -> DA:
     """Get images."""
     with open_dataset(PARAMS.paths.examples / f"{EXAMPLE_VIDEO_NAME}.nc") as ds:
-        return ds[VIDEO].sel(frame=slice(None, EXAMPLE_NUM_FRAMES))
+        return ds[VIDEO].sel(frame=slice(None, num_frames))
 
 
-EXAMPLE_VIDEO = get_images()
-EXAMPLE_FRAME_LIST = list(EXAMPLE_VIDEO.values)
+def get_frame_list(num_frames: int = EXAMPLE_NUM_FRAMES) -> list[Img]:
+    """Get example frames, materializing only those requested."""
+    # ? The frame selection slices by label inclusively, so clamp to the exact count
+    return list(get_images(num_frames).values[:num_frames])
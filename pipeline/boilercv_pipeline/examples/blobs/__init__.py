@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 from math import sqrt
 
+from numpy import concatenate
 from skimage.draw import disk, set_color
 from skimage.feature import blob_dog, blob_doh, blob_log
 
@@ -50,3 +51,15 @@ def draw_blobs(result, blob, color):
     """Draw blobs."""
     rr, cc = disk((int(blob.y), int(blob.x)), int(blob.r))
     set_color(result, (rr, cc), color)
+
+
+def draw_all_blobs(result, blobs, color):
+    """Draw all blobs in one pass over the image."""
+    disks = [disk((int(blob.y), int(blob.x)), int(blob.r)) for blob in blobs]
+    if not disks:
+        return
+    set_color(
+        result,
+        (concatenate([rr for rr, _ in disks]), concatenate([cc for _, cc in disks])),
+        color,
+    )
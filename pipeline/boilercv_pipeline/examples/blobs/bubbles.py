@@ -1,16 +1,16 @@
 """Find bubbles as blobs."""
 
-from cv2 import COLOR_GRAY2RGB
+from cv2 import COLOR_GRAY2RGB, add, bitwise_not
 
 from boilercv.colors import RED
-from boilercv.images.cv import apply_mask, build_mask_from_polygons, convert_image
+from boilercv.images.cv import build_mask_from_polygons, convert_image
 from boilercv.types import ArrInt
 from boilercv_pipeline.captivate.previews import edit_roi, view_images
-from boilercv_pipeline.examples import EXAMPLE_FRAME_LIST, EXAMPLE_ROI
-from boilercv_pipeline.examples.blobs import draw_blobs, get_blobs_doh
+from boilercv_pipeline.examples import EXAMPLE_ROI, get_frame_list
+from boilercv_pipeline.examples.blobs import draw_all_blobs, get_blobs_doh
 
 _NUM_FRAMES = 10
-SHORTER_FRAME_LIST = EXAMPLE_FRAME_LIST[:_NUM_FRAMES]
+SHORTER_FRAME_LIST = get_frame_list(_NUM_FRAMES)
 
 
 def main():  # noqa: D103
@@ -23,8 +23,10 @@ def main():  # noqa: D103
         # results_dog,
         results_doh
     ]
+    # ? The ROI mask is the same for every frame, so build and invert it once
+    unmasked = bitwise_not(build_mask_from_polygons(SHORTER_FRAME_LIST[0], [roi]))
     for input_image in SHORTER_FRAME_LIST:
-        image = apply_mask(input_image, build_mask_from_polygons(input_image, [roi]))
+        image = add(input_image, unmasked)
         all_blobs = [
             # get_blobs_log(image),
             # get_blobs_dog(image),
@@ -33,8 +35,7 @@ def main():  # noqa: D103
         sequence = zip(all_blobs, all_results, strict=True)
         for blobs, results in sequence:
             result = convert_image(input_image, COLOR_GRAY2RGB)
-            for blob in blobs:
-                draw_blobs(result, blob, RED)
+            draw_all_blobs(result, blobs, RED)
             results.append(result)
     view_images([SHORTER_FRAME_LIST, *all_results])
 
@@ -1,11 +1,15 @@
 """Get bubble contours."""
 
-from cv2 import CHAIN_APPROX_SIMPLE, bitwise_not
-from numpy import newaxis, repeat
+from concurrent.futures import ThreadPoolExecutor
+from os import cpu_count
+
+from cv2 import CHAIN_APPROX_SIMPLE
+from numpy import ascontiguousarray, broadcast_to, newaxis
+from pandas import concat
 
 from boilercv.colors import BLUE
-from boilercv.data import VIDEO, islice
-from boilercv.images import scale_bool
+from boilercv.data import VIDEO
+from boilercv.images import scale_bool, scale_bool_inverted
 from boilercv.images.cv import draw_contours
 from boilercv.types import ArrInt, Img
 from boilercv_pipeline import PREVIEW
@@ -15,26 +19,36 @@ from boilercv_pipeline.examples import (
     EXAMPLE_NUM_FRAMES,
     EXAMPLE_VIDEO_NAME,
 )
-from boilercv_pipeline.sets import get_dataset
-from boilercv_pipeline.stages.find_contours import get_all_contours
+from boilercv_pipeline.sets import get_dataset, split_contours_by_frame
+from boilercv_pipeline.stages.find_contours import FRAME_WINDOW, get_all_contours
 
 
 def main():  # noqa: D103
     ds = get_dataset(EXAMPLE_VIDEO_NAME, EXAMPLE_NUM_FRAMES)
     video = ds[VIDEO]
-    df = get_all_contours(
-        bitwise_not(scale_bool(video.values)), method=CHAIN_APPROX_SIMPLE
-    )
-    df.to_hdf(EXAMPLE_CONTOURS, "contours", complib="zlib", complevel=9)
-    result: list[Img] = []
-    for frame_num, frame in enumerate(video):
-        contours: list[ArrInt] = list(  # type: ignore  # pyright 1.1.333
-            df.loc[islice[frame_num], :]  # type: ignore  # pyright 1.1.333
-            .groupby("contour")
-            .apply(lambda grp: grp.values)  # type: ignore  # pyright 1.1.333
+    # ? Scale the whole video once and reuse it for the previews
+    scaled = scale_bool(video.values)
+    # ? Invert and process a window of frames at a time to bound intermediate buffers
+    df = concat([
+        get_all_contours(
+            scale_bool_inverted(video.values[start : start + FRAME_WINDOW]),
+            method=CHAIN_APPROX_SIMPLE,
+            start_frame=start,
+        )
+        for start in list(range(0, len(video), FRAME_WINDOW)) or [0]
+    ])
+    df.to_hdf(EXAMPLE_CONTOURS, "contours", complib="blosc:zstd", complevel=5)
+    contours_by_frame = split_contours_by_frame(df, len(video))
+
+    def process_frame(frame: Img, contours: list[ArrInt]) -> Img:
+        frame_color = ascontiguousarray(
+            broadcast_to(frame[:, :, newaxis], (*frame.shape, 3))
         )
-        frame_color = repeat(scale_bool(frame.values)[:, :, newaxis], 3, axis=-1)
-        result.append(draw_contours(frame_color, contours, thickness=2, color=BLUE))
+        return draw_contours(frame_color, contours, thickness=2, color=BLUE)
+
+    # ? OpenCV and numpy release the GIL, so threads parallelize the drawing
+    with ThreadPoolExecutor(max_workers=cpu_count() or 1) as executor:
+        result: list[Img] = list(executor.map(process_frame, scaled, contours_by_frame))
     if PREVIEW:
         view_images(result)
 
@@ -1,10 +1,12 @@
 """Basic examples using OpenCV sample files."""
 
 from collections.abc import Iterator
+from itertools import count
 from os import environ
 from pathlib import Path
 
-from cv2 import VideoCapture
+from cv2 import CAP_PROP_FRAME_HEIGHT, CAP_PROP_FRAME_WIDTH, VideoCapture
+from numpy import empty, uint8
 
 from boilercv.types import Img
 
@@ -26,12 +28,39 @@ def check_samples_env_var():
         )
 
 
-def capture_images(path: Path) -> Iterator[Img]:
-    """Load images from a video file."""
+def capture_images(
+    path: Path, stride: int = 1, reuse_buffer: bool = False
+) -> Iterator[Img]:
+    """Load images from a video file, decoding every `stride`-th frame.
+
+    With `reuse_buffer`, frames are decoded into one preallocated buffer which each
+    yielded frame aliases: consume or copy a frame before advancing the iterator.
+    """
     video_capture = VideoCapture(str(path))
-    while True:
-        read_is_successful, image = video_capture.read()
-        if not read_is_successful:
+    buffer = (
+        empty(
+            (
+                round(video_capture.get(CAP_PROP_FRAME_HEIGHT)),
+                round(video_capture.get(CAP_PROP_FRAME_WIDTH)),
+                3,
+            ),
+            uint8,
+        )
+        if reuse_buffer
+        else None
+    )
+    for frame in count():
+        # ? `grab` skips the decode that `read` would do for dropped frames
+        if not video_capture.grab():
+            break
+        if frame % stride:
+            continue
+        retrieve_is_successful, image = (
+            video_capture.retrieve()
+            if buffer is None
+            else video_capture.retrieve(buffer)
+        )
+        if not retrieve_is_successful:
             break
         yield image  # type: ignore  # pyright 1.1.333
 
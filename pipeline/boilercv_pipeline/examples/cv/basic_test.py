@@ -1,5 +1,6 @@
 """Preview a video."""
 
+from itertools import islice
 from pathlib import Path
 
 from cv2 import COLOR_BGR2RGB
@@ -12,10 +13,17 @@ from boilercv_pipeline import PREVIEW
 from boilercv_pipeline.captivate.previews import view_images
 from boilercv_pipeline.examples.cv import capture_images
 
+MAX_PREVIEW_FRAMES = 300
+"""Bound on frames held in memory for the preview."""
+
 
 def main(preview: bool = PREVIEW) -> Vid:  # noqa: D103
-    images = capture_images(Path(findFile("vtest.avi")))
-    video = stack([convert_image(image, COLOR_BGR2RGB) for image in images])
+    # ? The conversion copies each frame, so decoding can reuse one buffer
+    images = capture_images(Path(findFile("vtest.avi")), reuse_buffer=True)
+    video = stack([
+        convert_image(image, COLOR_BGR2RGB)
+        for image in islice(images, MAX_PREVIEW_FRAMES)
+    ])
     if preview:
         view_images(video)
     return video
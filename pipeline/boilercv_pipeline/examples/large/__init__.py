@@ -5,7 +5,7 @@ from contextlib import contextmanager
 
 from xarray import open_dataset
 
-from boilercv.data import VIDEO
+from boilercv.data import FRAME, VIDEO
 from boilercv.types import DS
 from boilercv_pipeline.captivate.previews import view_images
 from boilercv_pipeline.models.params import PARAMS
@@ -19,6 +19,7 @@ def example_dataset(
     destination: str = "",
     preview: bool = True,
     save: bool = True,
+    chunk_frames: int = 0,
     **kwargs,
 ) -> Iterator[DS]:  # sourcery skip: move-assign
     """Open the example dataset and write it to a destination file with a suffix.
@@ -29,6 +30,7 @@ def example_dataset(
         kwargs: Keyword arguments to pass to `xarray.Dataset.to_netcdf`.
         preview: Preview the original and modified datasets.
         save: Whether to save the file.
+        chunk_frames: If nonzero, read and store the video this many frames at a time.
     """
     _source = (
         PARAMS.paths.large_examples / f"{EXAMPLE.stem}_{source}.nc"
@@ -36,7 +38,10 @@ def example_dataset(
         else EXAMPLE
     )
     _destination = PARAMS.paths.large_examples / f"{EXAMPLE.stem}_{destination}.nc"
-    with open_dataset(_source) as ds:
+    # ? A chunked open backs the video with dask so writes stream window-by-window
+    with open_dataset(
+        _source, chunks={FRAME: chunk_frames} if chunk_frames else None
+    ) as ds:
         original = ds[VIDEO]
         try:
             yield ds
@@ -45,4 +50,10 @@ def example_dataset(
             if preview:
                 view_images(dict(original=original, updated=updated))
             if save:
+                if chunk_frames:
+                    video = ds[VIDEO]
+                    frames, *rest = (video.sizes[dim] for dim in video.dims)
+                    kwargs.setdefault("encoding", {}).setdefault(VIDEO, {})[
+                        "chunksizes"
+                    ] = (min(chunk_frames, frames), *rest)
                 ds.to_netcdf(path=_destination, **kwargs)
@@ -12,7 +12,8 @@ from boilercv_pipeline.examples.large import example_dataset
     source="packed",
     destination="packed_compressed",
     preview=DEBUG,
-    encoding={VIDEO: {"zlib": True}},
+    chunk_frames=64,
+    encoding={VIDEO: {"compression": "zstd", "complevel": 3}},
 )
 def main():  # noqa: D103
     pass
@@ -6,10 +6,15 @@ from boilercv_pipeline.video import prepare_dataset
 
 
 def main():  # noqa: D103
-    destination = (
-        PARAMS.paths.large_examples / f"{PARAMS.paths.large_example_cine.stem}.nc"
-    )
-    ds = prepare_dataset(PARAMS.paths.large_example_cine, num_frames=EXAMPLE_NUM_FRAMES)
+    source = PARAMS.paths.large_example_cine
+    destination = PARAMS.paths.large_examples / f"{source.stem}.nc"
+    # ? Skip the expensive CINE decode when the conversion is already current
+    if (
+        destination.exists()
+        and destination.stat().st_mtime_ns > source.stat().st_mtime_ns
+    ):
+        return
+    ds = prepare_dataset(source, num_frames=EXAMPLE_NUM_FRAMES)
     ds.to_netcdf(path=destination)
 
 
@@ -2,9 +2,9 @@
 
 from itertools import cycle
 
-from cv2 import COLOR_BGR2RGB, COLOR_GRAY2BGR
+from cv2 import COLOR_BGR2RGB
 from matplotlib.pyplot import show
-from numpy import zeros_like
+from numpy import zeros
 from seaborn import color_palette, palplot
 
 from boilercv.data import VIDEO
@@ -37,7 +37,7 @@ def main():  # noqa: D103
         .groupby("contour")
         .apply(lambda grp: grp.values)  # type: ignore  # pyright 1.1.333
     )
-    highlighted = zeros_like(convert_image(gray, COLOR_GRAY2BGR))
+    highlighted = zeros((*gray.shape, 3), dtype=gray.dtype)
     for contour, color in zip(contours, cycle(_PALETTE_CV), strict=False):
         highlighted = draw_contours(highlighted, [contour], color=color)
     highlighted = convert_image(highlighted, COLOR_BGR2RGB)
@@ -1,10 +1,11 @@
 """Subcooled bubble collapse experiment."""
 
 from collections.abc import Iterable, Iterator
-from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
+from os import cpu_count
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, TypedDict
@@ -64,27 +65,40 @@ def save_df(path: Path, ns: SimpleNamespace):
     getattr(ns, name).to_hdf(
         (path / f"{name}_{get_path_time(ns.TIME)}.h5"),
         key=path.stem,
-        complib="zlib",
-        complevel=9,
+        complib="blosc:zstd",
+        complevel=5,
     )
 
 
+def run_nb_processes(
+    nb: str, name: str, all_params: Iterable[Params], process: NbProcess = save_df
+):
+    """Run a notebook process across parameter sets, surfacing worker errors."""
+    all_params = list(all_params)
+    if not all_params:
+        return
+    max_workers = min(len(all_params), cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for future in as_completed([
+            submit_nb_process(
+                executor=executor, nb=nb, name=name, params=params, process=process
+            )
+            for params in all_params
+        ]):
+            future.result()
+
+
 def submit_nb_process(
     executor: ProcessPoolExecutor,
     nb: str,
     name: str,
     params: Params,
     process: NbProcess = save_df,
-):
+) -> Future[None]:
     """Submit a notebook process to an executor."""
     return executor.submit(
         apply_to_nb, nb=nb, name=name, params=params, process=process
-    ).add_done_callback(check_result)
-
-
-def check_result(future: Future[Any]):
-    """Resolve a future, reporting an exception if there is one."""
-    future.result()
+    )
 
 
 def apply_to_nb(nb: str, name: str, params: Params, process: NbProcess = save_df):
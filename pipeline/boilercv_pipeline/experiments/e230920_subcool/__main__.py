@@ -1,6 +1,7 @@
 """Subcooled bubble collapse experiment."""
 
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from os import cpu_count
 
 from boilercore.paths import fold, modified
 from ploomber_engine import execute_notebook
@@ -17,14 +18,20 @@ def main():  # noqa: D103
         input_path=fold(PARAMS.paths.stages[f"experiments_{EXP}_get_thermal_data"]),
         output_path=None,
     )
-    with ProcessPoolExecutor() as executor:
-        for dt in get_times(path.stem for path in EXP_DATA.iterdir()):
+    times = list(get_times(path.stem for path in EXP_DATA.iterdir()))
+    if not times:
+        return
+    with ProcessPoolExecutor(max_workers=min(len(times), cpu_count() or 1)) as executor:
+        for future in as_completed([
             executor.submit(
                 execute_notebook,
                 input_path=find_collapse,
                 output_path=None,
                 parameters={"TIME": dt.isoformat()},
             )
+            for dt in times
+        ]):
+            future.result()
 
 
 main()
@@ -1,19 +1,14 @@
 """Export all tracks for this experiment."""
 
-from concurrent.futures import ProcessPoolExecutor
-
-from boilercv_pipeline.experiments.e230920_subcool import EXP_TIMES, submit_nb_process
+from boilercv_pipeline.experiments.e230920_subcool import EXP_TIMES, run_nb_processes
 
 
 def main():  # noqa: D103
-    with ProcessPoolExecutor() as executor:
-        for dt in EXP_TIMES:
-            submit_nb_process(
-                executor=executor,
-                nb="find_tracks",
-                name="tracks",
-                params={"TIME": dt.isoformat()},
-            )
+    run_nb_processes(
+        nb="find_tracks",
+        name="tracks",
+        all_params=[{"TIME": dt.isoformat()} for dt in EXP_TIMES],
+    )
 
 
 if __name__ == "__main__":
@@ -1,13 +1,12 @@
 """Export correlation plots for tracks."""
 
-from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from types import SimpleNamespace
 
 from boilercv_pipeline.experiments.e230920_subcool import (
     EXP_TIMES,
     get_path_time,
-    submit_nb_process,
+    run_nb_processes,
 )
 
 PLOTS = Path("tests/plots/tracks")
@@ -15,15 +14,12 @@ PLOTS.mkdir(exist_ok=True)
 
 
 def main():  # noqa: D103
-    with ProcessPoolExecutor() as executor:
-        for dt in EXP_TIMES:
-            submit_nb_process(
-                executor=executor,
-                nb="plot_tracks",
-                name="tracks",
-                params={"TIME": dt.isoformat()},
-                process=export_track_plot,
-            )
+    run_nb_processes(
+        nb="plot_tracks",
+        name="tracks",
+        all_params=[{"TIME": dt.isoformat()} for dt in EXP_TIMES],
+        process=export_track_plot,
+    )
 
 
 def export_track_plot(_path: Path, ns: SimpleNamespace):
@@ -7,7 +7,10 @@ from boilercv_pipeline.experiments.e230920_subcool import EXP_DATA, read_nb
 
 def main():  # noqa: D103
     get_nb_ns(nb=read_nb("get_thermal_data"), attributes=["data"]).data.to_hdf(
-        EXP_DATA / "2023-09-20_thermal.h5", key="centers", complib="zlib", complevel=9
+        EXP_DATA / "2023-09-20_thermal.h5",
+        key="centers",
+        complib="blosc:zstd",
+        complevel=5,
     )
 
 
@@ -9,11 +9,17 @@ Directory structure looks like
         └───video
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
+from os import O_RDONLY, close, open, rename, scandir, supports_dir_fd
+from os.path import join
 from pathlib import Path
 
 from boilercv_pipeline.models.params import PARAMS
 
+MAX_RENAMERS = 16
+"""Threads for overlapping independent renames, which release the GIL."""
+
 
 def main():  # noqa: D103
     source = PARAMS.paths.hierarchical_data
@@ -22,36 +28,87 @@ def main():  # noqa: D103
     rename_sheets(source)
 
 
+def trial_dirs(source: Path) -> list[Path]:
+    """Trial directories, scanned without a stat call per entry."""
+    with scandir(source) as entries:
+        return [Path(entry.path) for entry in entries if entry.is_dir()]
+
+
+def scan_suffix(directory: Path, suffix: str) -> list[Path]:
+    """Files with the given suffix, scanned without the globbing machinery."""
+    try:
+        entries = scandir(directory)
+    except FileNotFoundError:
+        return []
+    with entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(suffix) and entry.is_file()
+        ]
+
+
 def rename_notes(source: Path):
     """Rename nested notes."""
-    notes_dest = PARAMS.paths.notes
-    notes_dirs = {
-        trial.stem: trial / "notes"
-        for trial in sorted(source.iterdir())
-        if trial.is_dir()
-    }
-    for trial, note_dir in notes_dirs.items():
-        if not note_dir.exists():
-            continue
-        note_dir.rename(notes_dest / trial)
+    notes_dest = str(PARAMS.paths.notes)
+    notes_dirs = {trial.stem: trial / "notes" for trial in trial_dirs(source)}
+
+    def rename_one(trial: str, note_dir: Path):
+        rename(str(note_dir), join(notes_dest, trial))  # noqa: PTH104, PTH118; fast path
+
+    existing = {t: d for t, d in notes_dirs.items() if d.exists()}
+    with ThreadPoolExecutor(max_workers=MAX_RENAMERS) as executor:
+        for _ in executor.map(rename_one, existing, existing.values()):
+            pass
 
 
 def rename_cines(source: Path):
     """Rename nested cines."""
-    destination = PARAMS.paths.cines
-    trials = [trial / "video" for trial in source.iterdir() if trial.is_dir()]
-    videos = sorted(chain.from_iterable(trial.glob("*.cine") for trial in trials))
-    for video in videos:
-        video.rename(destination / video.name.removeprefix("results_"))
+    destination = str(PARAMS.paths.cines)
+    trials = [trial / "video" for trial in trial_dirs(source)]
+    videos = sorted(
+        chain.from_iterable(scan_suffix(trial, ".cine") for trial in trials)
+    )
+    rename_flat(videos, destination)
 
 
 def rename_sheets(source: Path):
     """Rename nested sheets."""
-    sheets_dest = PARAMS.paths.sheets
-    data = [trial / "data" for trial in sorted(source.iterdir()) if trial.is_dir()]
-    sheets = sorted(chain.from_iterable(trial.glob("*.csv") for trial in data))
-    for sheet in sheets:
-        sheet.rename(sheets_dest / sheet.name.removeprefix("results_"))
+    sheets_dest = str(PARAMS.paths.sheets)
+    data = [trial / "data" for trial in trial_dirs(source)]
+    sheets = sorted(chain.from_iterable(scan_suffix(trial, ".csv") for trial in data))
+    rename_flat(sheets, sheets_dest)
+
+
+def rename_flat(files: list[Path], destination: str):
+    """Rename files into the destination, resolving each directory path once."""
+    use_dir_fd = rename in supports_dir_fd
+    fds: dict[str, int] = {}
+    if use_dir_fd:
+        fds[destination] = open(destination, O_RDONLY)
+        for parent in {str(file.parent) for file in files}:
+            if parent not in fds:
+                fds[parent] = open(parent, O_RDONLY)
+
+    def rename_one(file: Path):
+        target = file.name.removeprefix("results_")
+        if use_dir_fd:
+            rename(  # noqa: PTH104; Path.rename can't rename relative to dir fds
+                file.name,
+                target,
+                src_dir_fd=fds[str(file.parent)],
+                dst_dir_fd=fds[destination],
+            )
+        else:
+            rename(str(file), join(destination, target))  # noqa: PTH104, PTH118; fast path
+
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_RENAMERS) as executor:
+            for _ in executor.map(rename_one, files):
+                pass
+    finally:
+        for fd in fds.values():
+            close(fd)
 
 
 if __name__ == "__main__":
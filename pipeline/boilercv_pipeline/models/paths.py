@@ -1,5 +1,6 @@
 """Project paths."""
 
+from os import scandir
 from pathlib import Path
 
 from boilercore.models import CreatePathsModel
@@ -12,7 +13,10 @@ from boilercv_pipeline import PROJECT_PATH
 
 def get_sorted_paths(path: Path) -> list[Path]:
     """Iterate over a sorted directory."""
-    return sorted(path.iterdir())
+    with scandir(path) as entries:
+        return [
+            Path(entry.path) for entry in sorted(entries, key=lambda entry: entry.name)
+        ]
 
 
 class Paths(CreatePathsModel):
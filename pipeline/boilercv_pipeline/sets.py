@@ -1,17 +1,21 @@
 """Datasets."""
 
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from loguru import logger
+from numpy import diff, flatnonzero, split
 from pandas import read_hdf
 from xarray import Dataset, open_dataset
 
 from boilercv.correlations.types import Stage
 from boilercv.data import HEADER, ROI, VIDEO
 from boilercv.data.packing import unpack
-from boilercv.types import DF, DS
+from boilercv.types import DF, DS, ArrInt
 from boilercv_pipeline.models.params import PARAMS
 from boilercv_pipeline.models.paths import get_sorted_paths
 
@@ -21,6 +25,10 @@ ALL_STEMS = [source.stem for source in get_sorted_paths(PARAMS.paths.sources)]
 """The stems of all dataset sources."""
 STAGE_DEFAULT = "sources"
 """Default stage to work on."""
+UNCOMPRESSED_WRITER = ThreadPoolExecutor(max_workers=2)
+"""Executor overlapping uncompressed source writes with the caller's compute."""
+PENDING_UNCOMPRESSED: set[Path] = set()
+"""Uncompressed sources currently being written."""
 
 
 @contextmanager
@@ -90,11 +98,16 @@ def inspect_dataset(name: str, stage: Stage = STAGE_DEFAULT) -> DS:
     cmp_source, unc_source = get_stage(name, stage)
     source = unc_source if unc_source.exists() else cmp_source
     if stage == "large_sources":
-        return open_dataset(source) if source.exists() else Dataset()
+        return open_large_dataset(source) if source.exists() else Dataset()
     with open_dataset(source) as ds:
         return ds
 
 
+def open_large_dataset(source: Path) -> DS:
+    """Open a large source with `h5netcdf`, avoiding `libnetcdf`'s global lock."""
+    return open_dataset(source, engine="h5netcdf")
+
+
 def get_dataset(
     name: str,
     num_frames: int = 0,
@@ -102,13 +115,25 @@ def get_dataset(
     stage: Stage = STAGE_DEFAULT,
 ) -> DS:
     """Load a video dataset."""
+    frame = slice_frames(num_frames, frame)
+    # ? Full videos are too large to pin in the cache, which serves bounded loads
+    loader = _get_dataset if frame.stop is not None else _get_dataset.__wrapped__
+    # ? Slices aren't hashable, so key the cache on their components
+    return loader(name, frame.start, frame.stop, frame.step, stage)
+
+
+@lru_cache(maxsize=8)
+def _get_dataset(
+    name: str, start: int | None, stop: int | None, step: int | None, stage: Stage
+) -> DS:
+    """Load a video dataset, caching bounded loads for repeat callers."""
     # Can't use `xarray.open_mfdataset` because it requires dask
     # Unpacking is incompatible with dask
-    frame = slice_frames(num_frames, frame)
+    frame = slice(start, stop, step)
     cmp_source, unc_source = get_stage(name, stage)
     source = unc_source if unc_source.exists() else cmp_source
     if stage == "large_sources":
-        ds = open_dataset(source)
+        ds = open_large_dataset(source)
         return (
             Dataset({VIDEO: ds[VIDEO].sel(frame=frame), HEADER: ds[HEADER]})
             if source.exists()
@@ -116,10 +141,9 @@ def get_dataset(
         )
     roi = PARAMS.paths.rois / f"{name}.nc"
     with open_dataset(source) as ds, open_dataset(roi) as roi_ds:
-        if not unc_source.exists():
-            Dataset({VIDEO: ds[VIDEO], HEADER: ds[HEADER]}).to_netcdf(
-                path=unc_source, encoding={VIDEO: {"zlib": False}}
-            )
+        if not unc_source.exists() and unc_source not in PENDING_UNCOMPRESSED:
+            PENDING_UNCOMPRESSED.add(unc_source)
+            UNCOMPRESSED_WRITER.submit(write_uncompressed, source, unc_source)
         return Dataset({
             VIDEO: unpack(ds[VIDEO].sel(frame=frame)),
             ROI: roi_ds[ROI],
@@ -127,6 +151,26 @@ def get_dataset(
         })
 
 
+def write_uncompressed(source: Path, unc_source: Path):
+    """Write the uncompressed form of a source in the background.
+
+    Write to a sibling temporary file and rename into place so concurrent readers
+    either see the finished file or fall back to the compressed source.
+    """
+    tmp = unc_source.with_suffix(".tmp")
+    try:
+        with open_dataset(source) as ds:
+            Dataset({VIDEO: ds[VIDEO], HEADER: ds[HEADER]}).to_netcdf(
+                path=tmp, encoding={VIDEO: {"zlib": False}}
+            )
+        tmp.replace(unc_source)
+    except Exception:  # noqa: BLE001; worker boundary, surface any failure in the log
+        logger.exception(f"Failed writing uncompressed source {unc_source}")
+        tmp.unlink(missing_ok=True)
+    finally:
+        PENDING_UNCOMPRESSED.discard(unc_source)
+
+
 def get_stage(name: str, stage: Stage = STAGE_DEFAULT) -> tuple[Path, Path]:
     """Get the paths associated with a particular video name and pipeline stage."""
     if stage == "sources":
@@ -152,6 +196,25 @@ def get_contours_df(name: str) -> DF:
     return contour_df
 
 
+def split_contours_by_frame(contour_df: DF, num_frames: int) -> list[list[ArrInt]]:
+    """Split contour rows into per-frame contour lists in one linear pass.
+
+    Rows are already sorted by frame and contour, so group them by scanning for
+    boundaries rather than filtering and grouping the dataframe once per frame.
+    """
+    contours_by_frame: list[list[ArrInt]] = [[] for _ in range(num_frames)]
+    frame_idx = contour_df.index.get_level_values("frame").to_numpy()
+    if not len(frame_idx):
+        return contours_by_frame
+    contour_idx = contour_df.index.get_level_values("contour").to_numpy()
+    breaks = flatnonzero((diff(frame_idx) != 0) | (diff(contour_idx) != 0)) + 1
+    for start, contour in zip(
+        (0, *breaks), split(contour_df.to_numpy(), breaks), strict=True
+    ):
+        contours_by_frame[int(frame_idx[start])].append(contour)
+    return contours_by_frame
+
+
 def slice_frames(num_frames: int = 0, frame: slice = ALL_FRAMES) -> slice:
     """Return a slice suitable for getting frames from datasets."""
     if num_frames:
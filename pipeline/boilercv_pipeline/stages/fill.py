@@ -8,9 +8,13 @@ from boilercv.data import ROI, VIDEO
 from boilercv.data.packing import pack
 from boilercv.images import scale_bool
 from boilercv.images.cv import draw_contours
-from boilercv.types import ArrInt
 from boilercv_pipeline.models.params import PARAMS
-from boilercv_pipeline.sets import get_contours_df, get_dataset, process_datasets
+from boilercv_pipeline.sets import (
+    get_contours_df,
+    get_dataset,
+    process_datasets,
+    split_contours_by_frame,
+)
 
 
 def main():  # noqa: D103
@@ -22,14 +26,12 @@ def main():  # noqa: D103
             ds = zeros_like(source_ds, dtype=source_ds[VIDEO].dtype)
             video = ds[VIDEO]
             if not df.empty:
-                for frame_num, frame in enumerate(video):
-                    contours: list[ArrInt] = list(  # type: ignore  # pyright 1.1.333
-                        df.loc[frame_num, :]
-                        .groupby("contour")
-                        .apply(lambda grp: grp.values)  # type: ignore  # pyright 1.1.333
-                    )
+                # ? Scale the whole video once rather than once per frame
+                scaled = scale_bool(video.values)
+                contours_by_frame = split_contours_by_frame(df, len(video))
+                for frame_num in range(len(video)):
                     video[frame_num, :, :] = draw_contours(
-                        scale_bool(frame.values), contours
+                        scaled[frame_num], contours_by_frame[frame_num]
                     )
             ds[VIDEO] = pack(video)
             ds = ds.drop_vars(ROI)
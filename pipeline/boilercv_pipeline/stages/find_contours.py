@@ -1,27 +1,37 @@
 """Get bubble contours."""
 
-from cv2 import CHAIN_APPROX_SIMPLE, bitwise_not
+from cv2 import CHAIN_APPROX_SIMPLE
 from loguru import logger
-from numpy import empty, insert, vstack
-from pandas import DataFrame
+from numpy import empty, insert, int64, vstack
+from pandas import DataFrame, concat
 
 from boilercv.data import VIDEO
-from boilercv.images import scale_bool
+from boilercv.images import scale_bool_inverted
 from boilercv.images.cv import find_contours
 from boilercv.types import DF, Vid
 from boilercv_pipeline.models.params import PARAMS
 from boilercv_pipeline.sets import get_dataset, get_unprocessed_destinations
 
+FRAME_WINDOW = 64
+"""Frames to invert and process at a time, bounding intermediate buffers."""
+
 
 def main():  # noqa: D103
     destinations = get_unprocessed_destinations(PARAMS.paths.contours, ext="h5")
     for source_name, destination in destinations.items():
-        video = bitwise_not(scale_bool(get_dataset(source_name)[VIDEO].values))
-        df = get_all_contours(video, method=CHAIN_APPROX_SIMPLE)
-        df.to_hdf(destination, "contours", complib="zlib", complevel=9)
+        video = get_dataset(source_name)[VIDEO].values
+        df = concat([
+            get_all_contours(
+                scale_bool_inverted(video[start : start + FRAME_WINDOW]),
+                method=CHAIN_APPROX_SIMPLE,
+                start_frame=start,
+            )
+            for start in list(range(0, len(video), FRAME_WINDOW)) or [0]
+        ])
+        df.to_hdf(destination, "contours", complib="blosc:zstd", complevel=5)
 
 
-def get_all_contours(video: Vid, method) -> DF:
+def get_all_contours(video: Vid, method, start_frame: int = 0) -> DF:
     """Get all contours in a video.
 
     Produces a dataframe with a multi-index of the video frame and contour number, and
@@ -30,6 +40,7 @@ def get_all_contours(video: Vid, method) -> DF:
     Args:
         video: Video to get contours from.
         method: The contour approximation method to use.
+        start_frame: Frame number of the first frame in the video.
     """
     # This nested, pure-numpy approach is a bit hard to follow, but it is much faster
     # than the more readable approach of building and concatenating dataframes. The
@@ -56,13 +67,14 @@ def get_all_contours(video: Vid, method) -> DF:
                         ]
                     ),
                 )
-                for frame_num, image in enumerate(video)
+                for frame_num, image in enumerate(video, start=start_frame)
             ]
         )
     except ValueError:
-        # Some frames may have no contours. Signal this with an empty array
+        # Some frames may have no contours. Signal this with an empty array, keeping
+        # the integer dtype so concatenation with nonempty windows doesn't upcast
         logger.warning("No contours found in this frame.")
-        all_contours = empty((0, 4))
+        all_contours = empty((0, 4), dtype=int64)
     # Build the dataframe at the very end to avoid the overhead
     return DataFrame(
         all_contours, columns=["frame", "contour", "ypx", "xpx"]
@@ -1,21 +1,43 @@
 """Update previews for grayscale videos."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from loguru import logger
+from numpy import ascontiguousarray
 from tqdm import tqdm
 
 from boilercv.data import FRAME, VIDEO
+from boilercv.types import Img
 from boilercv_pipeline.models.params import PARAMS
 from boilercv_pipeline.sets import get_dataset
 from boilercv_pipeline.stages.preview import new_videos_to_preview
 
+STAGE = "large_sources"
+"""Stage to preview."""
+
 
 def main():  # noqa: D103
-    stage = "large_sources"
     destination = PARAMS.paths.gray_preview
     with new_videos_to_preview(destination) as videos_to_preview:
-        for video_name in tqdm(videos_to_preview):
-            if ds := get_dataset(video_name, stage=stage, num_frames=1):
-                videos_to_preview[video_name] = ds[VIDEO].isel({FRAME: 0}).values
+        names = list(videos_to_preview)
+        # ? The IO layer releases the GIL, so threads overlap the per-video reads
+        with ThreadPoolExecutor() as executor:
+            for video_name, frame in zip(
+                names,
+                tqdm(executor.map(get_first_frame, names), total=len(names)),
+                strict=True,
+            ):
+                if frame is not None:
+                    videos_to_preview[video_name] = frame
+
+
+def get_first_frame(video_name: str) -> Img | None:
+    """Get the first frame of a video, made contiguous for the preview writer."""
+    if not (ds := get_dataset(video_name, stage=STAGE, num_frames=1)):
+        return None
+    # ? Skip the conversion copy unless the selection is strided
+    frame = ds[VIDEO].isel({FRAME: 0}).to_numpy()
+    return frame if frame.flags.c_contiguous else ascontiguousarray(frame)
 
 
 if __name__ == "__main__":
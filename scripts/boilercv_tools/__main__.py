@@ -1,10 +1,14 @@
 """CLI for tools."""
 
+import sys
 from collections.abc import Collection
+from functools import lru_cache
 from pathlib import Path
-from re import finditer, sub
+from re import compile as compile_pattern
+from re import sub
 from shlex import join, split
 from tomllib import loads
+from typing import Any
 
 from cyclopts import App
 
@@ -15,6 +19,9 @@ from boilercv_tools.types import ChangeType
 APP = App(help_format="markdown")
 """CLI."""
 
+_USES = compile_pattern(r'uses:\s?"?(?P<action>[^@\s"]+)@')
+"""Pattern for actions used in workflows."""
+
 
 def main():  # noqa: D103
     APP()
@@ -47,13 +54,13 @@ def get_actions():
         Highest dependencies.
     """
     actions: list[str] = []
-    for contents in [
-        path.read_text("utf-8") for path in Path(".github/workflows").iterdir()
-    ]:
-        actions.extend([
-            f"{match['action']}@*,"
-            for match in finditer(r'uses:\s?"?(?P<action>.+)@', contents)
-        ])
+    for path in Path(".github/workflows").iterdir():
+        with path.open(encoding="utf-8") as file:
+            actions.extend([
+                f"{match['action']}@*,"
+                for line in file
+                if (match := _USES.search(line))
+            ])
     log(sorted(set(actions)))
 
 
@@ -67,8 +74,8 @@ def sync_local_dev_configs():
     shadowing. Concurrent test runs are disabled in the local pytest configuration which
     slows down the usual local, granular test workflow.
     """
-    config = loads(Path("pyproject.toml").read_text("utf-8"))
-    pytest = config["tool"]["pytest"]["ini_options"]
+    config = _load_pyproject(Path("pyproject.toml").stat().st_mtime_ns)
+    pytest = dict(config["tool"]["pytest"]["ini_options"])
     pytest["addopts"] = disable_concurrent_tests(pytest["addopts"])
     Path("pytest.ini").write_text(
         encoding="utf-8",
@@ -76,6 +83,12 @@ def sync_local_dev_configs():
     )
 
 
+@lru_cache(maxsize=1)
+def _load_pyproject(_mtime_ns: int) -> dict[str, Any]:
+    """Parse `pyproject.toml`, reusing the parse until the file changes."""
+    return loads(Path("pyproject.toml").read_text("utf-8"))
+
+
 def disable_concurrent_tests(addopts: str) -> str:
     """Normalize `addopts` string and disable concurrent pytest tests."""
     return sub(pattern=r"-n\s*[^\s]+", repl="-n 0", string=join(split(addopts)))
@@ -83,16 +96,24 @@ def disable_concurrent_tests(addopts: str) -> str:
 
 def log(obj):
     """Send object to `stdout`."""
+    parts: list[str] = []
+    _flatten(obj, parts)
+    if parts:
+        sys.stdout.write("\n".join(parts) + "\n")
+
+
+def _flatten(obj, parts: list[str]):
+    """Flatten object into lines to log."""
     match obj:
         case str():
-            print(obj)  # noqa: T201
+            parts.append(obj)
         case Collection():
             for o in obj:
-                log(o)
+                _flatten(o, parts)
         case Path():
-            log(escape(obj))
+            parts.append(escape(obj))
         case _:
-            print(obj)  # noqa: T201
+            parts.append(str(obj))
 
 
 if __name__ == "__main__":
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
+from functools import cache
 from json import dumps, loads
 from pathlib import Path
+from re import compile as compile_pattern
 from re import finditer
-from shlex import quote, split
+from shlex import quote
 from subprocess import run
 
 from boilercv_tools.types import Dep, PythonVersion, SubmoduleInfoKind, ops
@@ -91,18 +94,19 @@ def lock(directs: dict[str, Dep] | None = None, high: bool = False) -> str:
         ]),
         requirements=compilation.requirements,
     )
-    get_lockfile(high).write_text(
-        encoding="utf-8", data=dumps(indent=2, obj=asdict(contents)) + "\n"
+    get_lockfile(high).write_bytes(
+        (dumps(indent=2, obj=asdict(contents)) + "\n").encode("utf-8")
     )
     if not high:
-        REQUIREMENTS.write_text(encoding="utf-8", data=contents.requirements)
+        REQUIREMENTS.write_bytes(contents.requirements.encode("utf-8"))
     return compilation.requirements
 
 
+@cache
 def get_uv_version() -> str:
-    """Get version of `uv` at `bin/uv`."""
+    """Get version of `uv` at `bin/uv`, queried once per process."""
     result = run(
-        args=split("bin/uv --version"), capture_output=True, check=False, text=True
+        args=["bin/uv", "--version"], capture_output=True, check=False, text=True
     )
     if result.returncode:
         raise RuntimeError(result.stderr)
@@ -151,7 +155,16 @@ class Compiler:
         self, time: datetime = datetime.min, directs: dict[str, Dep] | None = None
     ) -> Compilation:
         """Compile dependencies."""
-        return Compilation(compiler=self, time=time, directs=directs or get_directs())
+        if directs:
+            return Compilation(compiler=self, time=time, directs=directs)
+        # ? The directs probe and the full compilation are independent `uv` runs
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future_directs = executor.submit(get_directs)
+            time, requirements = compile(self)
+            directs = future_directs.result()
+        return Compilation(
+            compiler=self, time=time, requirements=requirements, directs=directs
+        )
 
 
 NAME_PAT = r"[A-Za-z0-9]|[A-Za-z0-9][A-Za-z0-9._-]*[A-Za-z0-9]"
@@ -161,6 +174,8 @@ See: https://packaging.python.org/en/latest/specifications/name-normalization/#n
 """
 OP_PAT = "|".join(ops)
 """Regular expression for valid version separators."""
+DIRECT_PAT = compile_pattern(rf"(?m)^(?P<name>{NAME_PAT})(?P<op>{OP_PAT})(?P<rev>.+)$")
+"""Regular expression for direct dependencies, compiled once per process."""
 
 
 def get_directs(requirements: str | None = None) -> dict[str, Dep]:
@@ -168,9 +183,12 @@ def get_directs(requirements: str | None = None) -> dict[str, Dep]:
     directs: dict[str, Dep] = {}
     if not requirements:
         _, requirements = compile(Compiler(no_deps=True))
-    for direct in finditer(
-        rf"(?m)^(?P<name>{NAME_PAT})(?P<op>{OP_PAT})(?P<rev>.+)$", requirements
-    ):
+    for line in requirements.splitlines():
+        # ? Cheap prefilter so only candidate lines hit the backtracking regex engine
+        if not any(op in line for op in ops):
+            continue
+        if not (direct := DIRECT_PAT.match(line)):
+            continue
         op = direct["op"]
         if not isinstance(op, str) or op not in ops:
             raise ValueError(f"Invalid operator in {direct.groups()}")
@@ -198,6 +216,7 @@ class Compilation:
             self.requirements = requirements
 
 
+@cache
 def get_lockfile(high: bool = False) -> Path:
     """Get lockfile path."""
     return Path(f"lock{'-high' if high else ''}.json")
@@ -231,7 +250,7 @@ def get_subs() -> dict[str, Dep]:
         for item in (
             item.split()
             for item in run(
-                args=split("git submodule"), capture_output=True, check=True, text=True
+                args=["git", "submodule"], capture_output=True, check=True, text=True
             ).stdout.splitlines()
         )
     }
@@ -244,14 +263,20 @@ def get_subs() -> dict[str, Dep]:
     }
 
 
+@cache
 def get_submodule_info(kind: SubmoduleInfoKind) -> list[str]:
-    """Get submodule info."""
+    """Get submodule info, queried once per kind per process."""
     return [
         item.split()[1].removesuffix(".git")
         for item in run(
-            args=split(
-                f"git config --file .gitmodules --get-regexp {kind.removesuffix('s')}"
-            ),
+            args=[
+                "git",
+                "config",
+                "--file",
+                ".gitmodules",
+                "--get-regexp",
+                kind.removesuffix("s"),
+            ],
             capture_output=True,
             check=True,
             text=True,
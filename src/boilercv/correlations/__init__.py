@@ -1,6 +1,7 @@
 """Theoretical correlations for bubble lifetimes."""
 
 from collections.abc import Callable
+from functools import cache
 from pathlib import Path
 from tomllib import loads
 from typing import Any, cast, get_args
@@ -16,6 +17,7 @@ from boilercv.correlations.models import (
     SymbolicCorrelation,
 )
 from boilercv.correlations.types import AnyExpr, Equation, Sym, trivial_expr
+from boilercv.morphs.contexts import Context
 from boilercv.morphs.types import LiteralGenericAlias
 
 _base = Path(__file__).with_suffix(".toml")
@@ -34,6 +36,10 @@ SYMBOLS = {
     "pi": "pi",
 }
 
+FO_0_GRID = numpy.linspace(start=0.0, stop=5.0e-3, num=10)
+"""Grid of bubble Fourier numbers shared across correlation expectations."""
+FO_0_GRID.setflags(write=False)
+
 GROUPS = {
     k: f"Group {v}"
     for k, v in {
@@ -54,11 +60,42 @@ GROUPS = {
 }
 
 
+def load_toml(path: Path) -> dict[str, Any]:
+    """Load TOML file contents, cached until the file is modified."""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return _load_toml(path, mtime_ns)
+
+
+@cache
+def _load_toml(path: Path, _mtime_ns: int | None) -> dict[str, Any]:
+    """Load TOML file contents, keyed on path and modification time."""
+    try:
+        return loads(path.read_bytes().decode("utf-8"))
+    except FileNotFoundError:
+        return loads("")
+
+
+@cache
+def _equations_context() -> Context:
+    """Get the context for validating equations, built once per process."""
+    return Equations[AnyExpr].get_context(symbols=get_args(Sym))
+
+
+@cache
+def _solved_equations_context(solve_sym: LiteralGenericAlias) -> Context:
+    """Get the context for validating solved equations, built once per solve symbol."""
+    return SolvedEquations[str].get_context(
+        symbols=get_args(Sym), solve_syms=get_args(solve_sym)
+    )
+
+
 def get_equations(path: Path) -> Equations[AnyExpr]:
     """Get equations."""
     return Equations[AnyExpr].context_model_validate(
-        obj=loads(path.read_text("utf-8") if path.exists() else ""),
-        context=Equations[AnyExpr].get_context(symbols=get_args(Sym)),
+        obj=load_toml(path), context=_equations_context()
     )
 
 
@@ -66,9 +103,7 @@ def get_equations_and_solutions(
     equations: Path, solutions: Path, solve_sym: LiteralGenericAlias
 ) -> dict[Equation, SymbolicCorrelation]:
     """Get correlation equations and their solutions."""
-    context = SolvedEquations[str].get_context(
-        symbols=get_args(Sym), solve_syms=get_args(solve_sym)
-    )
+    context = _solved_equations_context(solve_sym)
     ranges = get_equations(RANGES_TOML)
     return {
         name: SymbolicCorrelation(
@@ -81,14 +116,7 @@ def get_equations_and_solutions(
         for name, soln in (
             SolvedEquations[solve_sym]
             .context_model_validate(
-                dict(
-                    equations=loads(
-                        equations.read_text("utf-8") if equations.exists() else ""
-                    ),
-                    solutions=loads(
-                        solutions.read_text("utf-8") if solutions.exists() else ""
-                    ),
-                ),
+                dict(equations=load_toml(equations), solutions=load_toml(solutions)),
                 context=context,
             )
             .solutions
@@ -113,8 +141,11 @@ def get_correlations(
 
 def lambdify_expr(expr: sympy.Basic) -> Callable[..., Any]:
     """Get symbolic functions."""
+    free_symbols = {s.name: s for s in expr.free_symbols}  # type: ignore
     return sympy.lambdify(
         expr=expr,
         modules=numpy,
-        args=[s for s in expr.free_symbols if s.name in SYMBOLS],  # type: ignore
+        # ? Order arguments deterministically, following `SYMBOLS`
+        args=[free_symbols[name] for name in SYMBOLS if name in free_symbols],
+        cse=True,
     )
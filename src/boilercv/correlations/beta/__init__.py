@@ -1,8 +1,9 @@
 """Dimensionless bubble diameter correlations for subcooled boiling bubble collapse."""
 
+from functools import cache
 from pathlib import Path
 
-from numpy import linspace, pi, sqrt
+from numpy import pi, sqrt
 
 from boilercv import correlations
 from boilercv.correlations.beta.types import SolveSym
@@ -20,10 +21,11 @@ EXPECTATIONS_TOML = _base.with_stem("expectations")
 """TOML file with expectations."""
 SOLUTIONS_TOML = _base.with_stem("solutions")
 """TOML file with solutions."""
-SYMBOL_EXPECTATIONS = Expectations[Sym].context_model_validate(
-    obj={
+# Trusted literal spanning all of `Sym`, so skip validation at import time
+SYMBOL_EXPECTATIONS = Expectations[Sym].model_construct(
+    root={
         "Nu_c": 1.0,
-        "Fo_0": linspace(start=0.0, stop=5.0e-3, num=10),
+        "Fo_0": correlations.FO_0_GRID,
         "Ja": 1.0,
         "Re_b": 10.0,
         "Re_b0": 100.0,
@@ -32,8 +34,7 @@ SYMBOL_EXPECTATIONS = Expectations[Sym].context_model_validate(
         "beta": 0.5,
         "alpha": 1.0,
         "pi": pi,
-    },
-    context=Expectations[Sym].get_context(),
+    }
 )
 """Common keyword arguments applied to correlations.
 
@@ -49,6 +50,7 @@ range as possible without returning `np.nan` values. This is done as follows:
 """
 
 
+@cache
 def get_equations_and_solutions() -> dict[Equation, SymbolicCorrelation]:
     """Get correlations."""
     return correlations.get_equations_and_solutions(
@@ -56,6 +58,7 @@ def get_equations_and_solutions() -> dict[Equation, SymbolicCorrelation]:
     )
 
 
+@cache
 def get_correlations() -> dict[Equation, Correlation]:
     """Get correlations."""
     return correlations.get_correlations(EQUATIONS_TOML, SOLUTIONS_TOML, SolveSym)
@@ -1,8 +1,9 @@
 """Nusselt number correlations for subcooled boiling bubble collapse."""
 
+from functools import cache
 from pathlib import Path
 
-from numpy import linspace, pi
+from numpy import nan, pi
 
 from boilercv import correlations
 from boilercv.correlations.models import Correlation, Expectations, SymbolicCorrelation
@@ -20,22 +21,25 @@ EXPECTATIONS_TOML = _base.with_stem("expectations")
 """TOML file with expectations."""
 SOLUTIONS_TOML = _base.with_stem("solutions")
 """TOML file with solutions."""
-SYMBOL_EXPECTATIONS = Expectations[Sym].context_model_validate(
-    obj={
+# Trusted literal spanning all of `Sym`, so skip validation at import time
+SYMBOL_EXPECTATIONS = Expectations[Sym].model_construct(
+    root={
         "Nu_c": 1.0,
-        "Fo_0": linspace(start=0.0, stop=5.0e-3, num=10),
+        "Fo_0": correlations.FO_0_GRID,
         "Ja": 1.0,
+        "Re_b": nan,
         "Re_b0": 100.0,
+        "Pe": nan,
         "Pr": 1.0,
         "beta": 0.5,
         "alpha": 1.0,
         "pi": pi,
-    },
-    context=Expectations[Sym].get_context(),
+    }
 )
 """Common keyword arguments applied to correlations."""
 
 
+@cache
 def get_equations_and_solutions() -> dict[Equation, SymbolicCorrelation]:
     """Get correlations."""
     return correlations.get_equations_and_solutions(
@@ -43,6 +47,7 @@ def get_equations_and_solutions() -> dict[Equation, SymbolicCorrelation]:
     )
 
 
+@cache
 def get_correlations() -> dict[Equation, Correlation]:
     """Get correlations."""
     return correlations.get_correlations(EQUATIONS_TOML, SOLUTIONS_TOML, SolveSym)
@@ -21,6 +21,14 @@ from boilercv.morphs.contexts import (
 )
 from boilercv.morphs.morphs import Morph
 
+WHITESPACE_TABLE = str.maketrans(dict.fromkeys(whitespace, " "))
+"""Translation table mapping all whitespace characters to spaces."""
+LATEX_REPLS = tuple(
+    Repl[Kind](src="latex", dst="sympy", find=find, repl=repl)
+    for find, repl in {r"_\b0": "_bo", r"_\o": "_0", "\\": ""}.items()
+)
+"""Replacements to adapt LaTeX forms to SymPy, built once."""
+
 
 def fold_whitespace(
     forms: dict[Kind, str], defaults: Defaults[Kind, str]
@@ -29,12 +37,7 @@ def fold_whitespace(
     return (
         Morph[Kind, str](forms)
         .morph_pipe(
-            replace,
-            (
-                Repl[Kind](src=key, dst=key, find=find, repl=" ")
-                for find in whitespace
-                for key in defaults.keys
-            ),
+            lambda forms: {k: v.translate(WHITESPACE_TABLE) for k, v in forms.items()}
         )
         .morph_pipe(
             replace_pattern,
@@ -66,13 +69,7 @@ def set_latex_forms(forms: Morph[Kind, str]) -> Morph[Kind, str]:
     """Set forms for parameters."""
     if forms["sympy"] and not forms["latex"]:
         forms["latex"] = forms["sympy"]
-    forms = forms.morph_pipe(
-        replace,
-        repls=[
-            Repl[Kind](src="latex", dst="sympy", find=k, repl=v)
-            for k, v in {r"_\b0": "_bo", r"_\o": "_0", "\\": ""}.items()
-        ],
-    )
+    forms = forms.morph_pipe(replace, repls=LATEX_REPLS)
     return forms
 
 
@@ -2,6 +2,7 @@
 
 from collections.abc import Callable, Mapping
 from dataclasses import asdict, dataclass
+from functools import cache
 from pathlib import Path
 from types import SimpleNamespace
 from typing import (
@@ -164,8 +165,9 @@ AnyEquation: TypeAlias = Equation | ExtraEquation
 WhenUsed: TypeAlias = Literal["always", "unless-none", "json", "json-unless-none"]
 
 
+@cache
 def StrSerializer(when_used: WhenUsed = "always") -> WrapSerializer:  # noqa: N802; Can't inherit from frozen
-    """Serialize as string."""
+    """Serialize as string, sharing one serializer per use case."""
     return WrapSerializer(_str, when_used=when_used)
 
 
@@ -194,8 +196,9 @@ def TypeValidator(typ: type[K], mode: Literal["after"]) -> AfterValidator: ...
 def TypeValidator(typ: type[K], mode: Literal["plain"]) -> PlainValidator: ...
 @overload
 def TypeValidator(typ: type[K]) -> PlainValidator: ...
+@cache
 def TypeValidator(typ: type[K], mode: Validator = "plain") -> Any:  # noqa: N802; Can't inherit from frozen
-    """Validate type."""
+    """Validate type, sharing one validator per type and mode."""
 
     def validate(v: K) -> K:
         if isinstance(v, typ):
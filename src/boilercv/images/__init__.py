@@ -6,7 +6,7 @@
 from typing import Any
 
 from matplotlib.font_manager import FontProperties, findfont
-from numpy import asarray, iinfo, invert, mean, uint8
+from numpy import asarray, iinfo, invert, mean, uint8, where
 from numpy.typing import DTypeLike
 from PIL import Image, ImageDraw, ImageFont, ImageOps
 
@@ -43,6 +43,15 @@ def scale_bool(img: Any, dtype: DTypeLike = uint8) -> Any:
     return img.astype(dtype) * iinfo(dtype).max
 
 
+def scale_bool_inverted(img: Any, dtype: DTypeLike = uint8) -> Any:
+    """Return the inverted input as `dtype` multiplied by the max value of `dtype`.
+
+    Fuses `scale_bool` and bitwise inversion into one pass over the input, halving
+    memory traffic for large videos.
+    """
+    return where(img, asarray(0, dtype), asarray(iinfo(dtype).max, dtype))
+
+
 # * -------------------------------------------------------------------------------- * #
 # * OTHER - NOT ALWAYS TYPE PRESERVING
 
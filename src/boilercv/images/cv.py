@@ -95,13 +95,21 @@ def binarize(img: Img, block_size: int = 11, thresh_dist_from_mean: int = 2) ->
     ).astype(bool)
 
 
+_FLOOD_MASK_SCRATCH: dict[tuple[tuple[int, ...], str], Img] = {}
+"""Per-shape padded flood masks, reset and reused across frame loops."""
+
+
 def flood(img: Img) -> ImgBool:
     """Flood the image, returning the resulting flood as a bright mask."""
     seed_point = array(img.shape) // 2
     _max_value = iinfo(img.dtype).max
     # OpenCV needs a masked array with a one-pixel pad
     pad_width = 1
-    mask = pad(zeros_like(img), pad_width, value=1)
+    key = (img.shape, str(img.dtype))
+    if (mask := _FLOOD_MASK_SCRATCH.get(key)) is None:
+        mask = _FLOOD_MASK_SCRATCH[key] = pad(zeros_like(img), pad_width, value=1)
+    else:
+        unpad(mask, pad_width).fill(0)
     _retval, _image, mask, _rect = floodFill(
         image=img,
         mask=mask,
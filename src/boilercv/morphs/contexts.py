@@ -28,6 +28,12 @@ from boilercv.morphs.types import (
     V,
 )
 
+
+def identity(v: Any) -> Any:
+    """Return the value unchanged, the default copier for shared default values."""
+    return v
+
+
 # * MARK: Base context
 
 
@@ -226,7 +232,7 @@ class ContextMorph(Morph[K, V], BaseContext, Generic[K, V]):
         mapping: dict[K, V | BaseModel] | None = None,
         keys: tuple[K, ...] | None = None,
         value: V | BaseModel | None = None,
-        value_copier: Callable[[V | BaseModel], V | BaseModel] = lambda v: v,
+        value_copier: Callable[[V | BaseModel], V | BaseModel] = identity,
         factory: Callable[..., Any] | None = None,
         value_model: type[ContextMorph[K, V] | ContextBaseModel | BaseModel]
         | None = None,
@@ -396,7 +402,7 @@ class Defaults(ContextValue, Generic[K, V]):
     """Default value."""
     factory: Callable[..., Any] | None = None
     """Default value factory."""
-    value_copier: Callable[[V], V] | None = lambda v: v
+    value_copier: Callable[[V], V] | None = identity
     """Method to copy the default value."""
 
 
@@ -406,7 +412,7 @@ class Defaults(ContextValue, Generic[K, V]):
 def set_defaults(i: dict[K, V], d: Defaults[K, V]) -> dict[K, V]:
     """Set `self.default_keys` using `self.default_factory` or `self.default`."""
     if not d.value_copier:
-        d.value_copier = lambda v: v
+        d.value_copier = identity
     if d.mapping:
         if d.keys or d.value or d.factory:
             raise ValueError(
@@ -419,6 +425,9 @@ def set_defaults(i: dict[K, V], d: Defaults[K, V]) -> dict[K, V]:
         if d.factory:
             return {key: d.factory() for key in d.keys} | i
         if d.value is not None:
+            if d.value_copier is identity:
+                # ? Identity copier: share the value via the C fast path
+                return dict.fromkeys(d.keys, d.value) | i
             return {key: d.value_copier(d.value) for key in d.keys} | i
         raise ValueError("No default value or factory specified.")
     return i
@@ -4,7 +4,7 @@ from inspect import Signature
 from tomllib import loads
 
 import pytest
-from numpy import allclose, bool_
+from numpy import allclose, bool_, ones
 
 from boilercv.correlations import SYMBOLS, beta
 from boilercv.correlations.beta import (
@@ -17,54 +17,49 @@ EXPECTATIONS = loads(EXPECTATIONS_TOML.read_text("utf-8"))
 CORRELATIONS = get_correlations()
 exprs = {name: corr.expr for name, corr in CORRELATIONS.items()}
 ranges = {name: corr.range for name, corr in CORRELATIONS.items()}
+# ? Vector inputs exercise the vectorized branch of the lambdified ranges
+RANGE_KWDS = {kwd: ones(1) for kwd in ("Nu_c", "Ja", "Re_b", "Pe", "Pr", "alpha")}
+
+
+def prepare_kwds(equation, kwds, symbols=None) -> dict:
+    """Filter keywords to an equation's parameters, reflecting it only once."""
+    params = Signature.from_callable(equation).parameters
+    if symbols:
+        return {symbols[k]: v for k, v in kwds.items() if symbols[k] in params}
+    return {k: v for k, v in kwds.items() if k in params}
+
+
+PYTHON_KWDS = {
+    name: prepare_kwds(getattr(beta, name), SYMBOL_EXPECTATIONS, SYMBOLS)
+    for name in EXPECTATIONS
+}
+CORRELATION_KWDS = {
+    name: prepare_kwds(exprs[name], SYMBOL_EXPECTATIONS) for name in EXPECTATIONS
+}
+RANGE_KWDS_BY_NAME = {
+    name: prepare_kwds(ranges[name], RANGE_KWDS) if ranges[name] else {}
+    for name in EXPECTATIONS
+}
 
 
 @pytest.mark.parametrize(("name", "expected"), EXPECTATIONS.items())
 def test_python(name, expected):
     """Equations evaluate as expected."""
-    equation = getattr(beta, name)
-    result = equation(**{
-        SYMBOLS[kwd]: value
-        for kwd, value in SYMBOL_EXPECTATIONS.items()
-        if SYMBOLS[kwd] in Signature.from_callable(equation).parameters
-    })
+    result = getattr(beta, name)(**PYTHON_KWDS[name])
     assert allclose(result, expected)
 
 
-@pytest.mark.parametrize(
-    ("corr", "expected"),
-    ((exprs[name], expected) for name, expected in EXPECTATIONS.items()),
-    ids=EXPECTATIONS,
-)
-def test_correlations(corr, expected):
+@pytest.mark.parametrize(("name", "expected"), EXPECTATIONS.items(), ids=EXPECTATIONS)
+def test_correlations(name, expected):
     """Symbolic equations evaluate as expected."""
-    result = corr(**{
-        kwd: value
-        for kwd, value in SYMBOL_EXPECTATIONS.items()
-        if kwd in Signature.from_callable(corr).parameters
-    })
+    result = exprs[name](**CORRELATION_KWDS[name])
     assert allclose(result, expected, rtol=1.0e-4)
 
 
-@pytest.mark.parametrize(
-    ("range_"), (ranges[name] for name in EXPECTATIONS), ids=EXPECTATIONS
-)
-def test_correlation_ranges(range_):
+@pytest.mark.parametrize(("name"), EXPECTATIONS, ids=EXPECTATIONS)
+def test_correlation_ranges(name):
     """Symbolic ranges evaluate as expected."""
-    if not range_:
+    if not (range_ := ranges[name]):
         return
-    assert isinstance(
-        range_(**{
-            kwd: value
-            for kwd, value in {
-                "Nu_c": 1.0,
-                "Ja": 1.0,
-                "Re_b": 1.0,
-                "Pe": 1.0,
-                "Pr": 1.0,
-                "alpha": 1.0,
-            }.items()
-            if kwd in Signature.from_callable(range_).parameters
-        }),
-        bool_,
-    )
+    result = range_(**RANGE_KWDS_BY_NAME[name])
+    assert result.dtype == bool_
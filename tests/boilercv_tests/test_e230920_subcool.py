@@ -8,7 +8,8 @@ from pandas.testing import assert_index_equal
 
 from boilercv_tests import Caser, parametrize_by_cases
 
-pytestmark = pytest.mark.slow
+# ? Keep this module's tests on one worker: they share module-scoped namespaces
+pytestmark = [pytest.mark.slow, pytest.mark.xdist_group("e230920_subcool")]
 C = Caser(Path("docs/experiments/e230920_subcool"))
 
 